@@ -1,70 +1,381 @@
+import heapq
 import tkinter as tk
-from collections import deque
+
+import numpy as np
+from numba import njit
 
 # Directions for robot movement (Up, Down, Left, Right)
-directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+DX = (-1, 1, 0, 0)
+DY = (0, 0, -1, 1)
+
+@njit(cache=True, inline="always")
+def _visit(grid, visited, parent, buf, tail, nx, ny, cidx, W):
+    """Mark an open, unvisited neighbor, record its parent and push it onto buf"""
+    if grid[nx, ny] != 0:
+        return tail
+    nidx = nx * W + ny
+    if visited[nidx >> 3] & (1 << (nidx & 7)):
+        return tail
+    visited[nidx >> 3] |= 1 << (nidx & 7)
+    parent[nidx] = cidx
+    buf[tail] = nidx
+    return tail + 1
+
+@njit(cache=True)
+def _search(grid, sx, sy, ex, ey, pop_index):
+    """BFS (pop_index 0) or DFS (pop_index -1) kernel: return the parent array (-1 for unreached cells)"""
+    H, W = grid.shape
+    visited = np.zeros((H * W + 7) >> 3, dtype=np.uint8)  # One bit per cell
+    parent = np.full(H * W, -1, dtype=np.int32)
+    frontier = np.empty(H * W, dtype=np.int32)  # Queue or stack; each cell is pushed at most once
+    start_idx = sx * W + sy
+    end_idx = ex * W + ey
+    visited[start_idx >> 3] |= 1 << (start_idx & 7)
+    parent[start_idx] = start_idx
+    frontier[0] = start_idx
+    head, tail = 0, 1
+
+    while head < tail:
+        if pop_index == 0:
+            cidx = frontier[head]
+            head += 1
+        else:
+            tail -= 1
+            cidx = frontier[tail]
+        if cidx == end_idx:
+            break
+        cx, cy = cidx // W, cidx % W
+        # Unrolled neighbors: Up, Down, Left, Right
+        if cx > 0:
+            tail = _visit(grid, visited, parent, frontier, tail, cx - 1, cy, cidx, W)
+        if cx < H - 1:
+            tail = _visit(grid, visited, parent, frontier, tail, cx + 1, cy, cidx, W)
+        if cy > 0:
+            tail = _visit(grid, visited, parent, frontier, tail, cx, cy - 1, cidx, W)
+        if cy < W - 1:
+            tail = _visit(grid, visited, parent, frontier, tail, cx, cy + 1, cidx, W)
+
+    return parent
 
-def is_valid_move(x, y, grid, visited):
-    """Check if the move is within bounds, not blocked, and not visited"""
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0]) and grid[x][y] == 0 and not visited[x][y]
+def reconstruct_path(parent, start, end, W):
+    """Walk the parent array back from end to start and return the path"""
+    start_idx = start[0] * W + start[1]
+    current = end[0] * W + end[1]
+    if parent[current] == -1:
+        return []  # Return empty list if no path exists
+    path = [end]
+    while current != start_idx:
+        current = int(parent[current])
+        path.append(divmod(current, W))
+    return path[::-1]  # Reverse the path to get it from start to end
 
 def bfs(start, end, grid):
     """Breadth-First Search to find the shortest path"""
-    queue = deque([start])
-    visited = [[False for _ in range(len(grid[0]))] for _ in range(len(grid))]
-    visited[start[0]][start[1]] = True
-    parent = {start: None}
-    
-    while queue:
-        current = queue.popleft()
-        
-        if current == end:
-            # Reconstruct the path
-            path = []
-            while current:
-                path.append(current)
-                current = parent[current]
-            return path[::-1]  # Reverse the path to get it from start to end
-        
-        for direction in directions:
-            new_x, new_y = current[0] + direction[0], current[1] + direction[1]
-            if is_valid_move(new_x, new_y, grid, visited):
-                visited[new_x][new_y] = True
-                queue.append((new_x, new_y))
-                parent[(new_x, new_y)] = current
-    
-    return []  # Return empty list if no path exists
+    parent = _search(grid, start[0], start[1], end[0], end[1], 0)
+    return reconstruct_path(parent, start, end, grid.shape[1])
 
 def dfs(start, end, grid):
     """Depth-First Search to find the path"""
-    stack = [start]
-    visited = [[False for _ in range(len(grid[0]))] for _ in range(len(grid))]
-    visited[start[0]][start[1]] = True
-    parent = {start: None}
-    
-    while stack:
-        current = stack.pop()
-        
-        if current == end:
-            # Reconstruct the path
-            path = []
-            while current:
-                path.append(current)
-                current = parent[current]
-            return path[::-1]  # Reverse the path to get it from start to end
-        
-        for direction in directions:
-            new_x, new_y = current[0] + direction[0], current[1] + direction[1]
-            if is_valid_move(new_x, new_y, grid, visited):
-                visited[new_x][new_y] = True
-                stack.append((new_x, new_y))
-                parent[(new_x, new_y)] = current
-    
+    parent = _search(grid, start[0], start[1], end[0], end[1], -1)
+    return reconstruct_path(parent, start, end, grid.shape[1])
+
+@njit(cache=True)
+def _expand_layer(grid, queue, head, tail, visited, parent, other_visited):
+    """Expand the layer queue[head:tail]; return (meeting cell or -1, next head, next tail)"""
+    H, W = grid.shape
+    new_tail = tail
+    for i in range(head, tail):
+        cidx = queue[i]
+        cx, cy = cidx // W, cidx % W
+        pushed = new_tail
+        # Unrolled neighbors: Up, Down, Left, Right
+        if cx > 0:
+            new_tail = _visit(grid, visited, parent, queue, new_tail, cx - 1, cy, cidx, W)
+        if cx < H - 1:
+            new_tail = _visit(grid, visited, parent, queue, new_tail, cx + 1, cy, cidx, W)
+        if cy > 0:
+            new_tail = _visit(grid, visited, parent, queue, new_tail, cx, cy - 1, cidx, W)
+        if cy < W - 1:
+            new_tail = _visit(grid, visited, parent, queue, new_tail, cx, cy + 1, cidx, W)
+        for j in range(pushed, new_tail):
+            idx = queue[j]
+            if other_visited[idx >> 3] & (1 << (idx & 7)):
+                return idx, tail, new_tail
+    return -1, tail, new_tail
+
+@njit(cache=True)
+def _bibfs(grid, sx, sy, ex, ey):
+    """Bidirectional BFS kernel: return (forward parents, backward parents, meeting cell or -1)"""
+    H, W = grid.shape
+    start_idx = sx * W + sy
+    end_idx = ex * W + ey
+    vf = np.zeros((H * W + 7) >> 3, dtype=np.uint8)  # Cells reached from start
+    vb = np.zeros((H * W + 7) >> 3, dtype=np.uint8)  # Cells reached from end
+    vf[start_idx >> 3] |= 1 << (start_idx & 7)
+    vb[end_idx >> 3] |= 1 << (end_idx & 7)
+    pf = np.full(H * W, -1, dtype=np.int32)  # Predecessor on the way back to start
+    pb = np.full(H * W, -1, dtype=np.int32)  # Successor on the way on to end
+    pf[start_idx] = start_idx
+    pb[end_idx] = end_idx
+    # Preallocated queues; each side enqueues a cell at most once, so they never wrap
+    qf = np.empty(H * W, dtype=np.int32)
+    qb = np.empty(H * W, dtype=np.int32)
+    qf[0] = start_idx
+    qb[0] = end_idx
+    hf, tf = 0, 1
+    hb, tb = 0, 1
+
+    while hf < tf and hb < tb:
+        # Expand whichever frontier is smaller by one full layer
+        if tf - hf <= tb - hb:
+            meet, hf, tf = _expand_layer(grid, qf, hf, tf, vf, pf, vb)
+        else:
+            meet, hb, tb = _expand_layer(grid, qb, hb, tb, vb, pb, vf)
+        if meet != -1:
+            return pf, pb, meet
+
+    return pf, pb, -1
+
+def bibfs(start, end, grid):
+    """Bidirectional BFS: grow frontiers from both ends until they meet"""
+    if grid[end] != 0:
+        return []  # The destination is a wall; don't grow a backward frontier out of it
+    if start == end:
+        return [start]
+    W = grid.shape[1]
+    pf, pb, meet = _bibfs(grid, start[0], start[1], end[0], end[1])
+    if meet == -1:
+        return []  # Return empty list if no path exists
+
+    # Reconstruct the path: start -> meet from pf, meet -> end from pb
+    end_idx = end[0] * W + end[1]
+    path = reconstruct_path(pf, start, divmod(meet, W), W)
+    current = meet
+    while current != end_idx:
+        current = int(pb[current])
+        path.append(divmod(current, W))
+    return path
+
+def astar(start, end, grid):
+    """A* search with the Manhattan distance heuristic to find the shortest path"""
+    H, W = grid.shape
+    ex, ey = end
+    start_idx = start[0] * W + start[1]
+    end_idx = ex * W + ey
+    g = np.full(H * W, np.iinfo(np.int32).max, dtype=np.int32)  # Best known cost from start
+    closed = bytearray((H * W + 7) >> 3)  # One bit per expanded cell
+    parent = np.full(H * W, -1, dtype=np.int32)
+    g[start_idx] = 0
+    parent[start_idx] = start_idx
+    counter = 0  # Final tie-breaker so equal (f, h) pairs pop in insertion order
+    h = abs(start[0] - ex) + abs(start[1] - ey)
+    # Heap entries are (f, h, counter, cell): among equal f, prefer the cell nearest the goal
+    open_heap = [(h, h, counter, start_idx)]
+
+    while open_heap:
+        _, _, _, cidx = heapq.heappop(open_heap)
+        if closed[cidx >> 3] & (1 << (cidx & 7)):
+            continue  # Stale heap entry
+        closed[cidx >> 3] |= 1 << (cidx & 7)
+
+        if cidx == end_idx:
+            return reconstruct_path(parent, start, end, W)
+
+        cx, cy = divmod(cidx, W)
+        new_g = int(g[cidx]) + 1
+        # Unrolled neighbors: Up, Down, Left, Right
+        if cx > 0 and grid[cx - 1, cy] == 0:
+            idx = cidx - W
+            if new_g < g[idx]:
+                g[idx] = new_g
+                parent[idx] = cidx
+                counter += 1
+                h = abs(cx - 1 - ex) + abs(cy - ey)
+                heapq.heappush(open_heap, (new_g + h, h, counter, idx))
+        if cx < H - 1 and grid[cx + 1, cy] == 0:
+            idx = cidx + W
+            if new_g < g[idx]:
+                g[idx] = new_g
+                parent[idx] = cidx
+                counter += 1
+                h = abs(cx + 1 - ex) + abs(cy - ey)
+                heapq.heappush(open_heap, (new_g + h, h, counter, idx))
+        if cy > 0 and grid[cx, cy - 1] == 0:
+            idx = cidx - 1
+            if new_g < g[idx]:
+                g[idx] = new_g
+                parent[idx] = cidx
+                counter += 1
+                h = abs(cx - ex) + abs(cy - 1 - ey)
+                heapq.heappush(open_heap, (new_g + h, h, counter, idx))
+        if cy < W - 1 and grid[cx, cy + 1] == 0:
+            idx = cidx + 1
+            if new_g < g[idx]:
+                g[idx] = new_g
+                parent[idx] = cidx
+                counter += 1
+                h = abs(cx - ex) + abs(cy + 1 - ey)
+                heapq.heappush(open_heap, (new_g + h, h, counter, idx))
+
     return []  # Return empty list if no path exists
 
+def idastar(start, end, grid):
+    """Iterative Deepening A*: depth-first searches under a growing f = g + Manhattan bound"""
+    H, W = grid.shape
+    ex, ey = end
+    if grid[end] != 0:
+        return []  # The destination is a wall
+    if _search(grid, start[0], start[1], ex, ey, 0)[ex * W + ey] == -1:
+        return []  # Unreachable; otherwise the bound would climb through every f in the open region
+    FOUND = -1
+    path = [start]  # Current search stack, which is the path once the goal is found
+    best_g = None  # Cheapest g seen per cell in the current iteration
+
+    def dfs_bound(x, y, g, bound):
+        """Search below (x, y); return FOUND or the smallest f that exceeded bound"""
+        idx = x * W + y
+        if g >= best_g[idx]:
+            return np.inf  # Reached this cell at least as cheaply already (also rejects cycles)
+        best_g[idx] = g
+        f = g + abs(x - ex) + abs(y - ey)
+        if f > bound:
+            return f
+        if x == ex and y == ey:
+            return FOUND
+        next_bound = np.inf
+        for k in range(4):
+            new_x, new_y = x + DX[k], y + DY[k]
+            if 0 <= new_x < H and 0 <= new_y < W and grid[new_x, new_y] == 0:
+                path.append((new_x, new_y))
+                t = dfs_bound(new_x, new_y, g + 1, bound)
+                if t == FOUND:
+                    return FOUND
+                path.pop()
+                next_bound = min(next_bound, t)
+        return next_bound
+
+    bound = abs(start[0] - ex) + abs(start[1] - ey)
+    while bound != np.inf:
+        best_g = np.full(H * W, np.iinfo(np.int32).max, dtype=np.int32)
+        bound = dfs_bound(start[0], start[1], 0, bound)
+        if bound == FOUND:
+            return path
+
+    return []  # Return empty list if no path exists
+
+@njit(cache=True)
+def _jump_horizontal(grid, H, W, x, y, dy, ex, ey):
+    """Step from (x, y) along the row in direction dy; return the next jump point's index or -1"""
+    while True:
+        y += dy
+        if not (0 <= y < W) or grid[x, y] != 0:
+            return -1
+        if x == ex and y == ey:
+            return x * W + y
+        # A side cell that was blocked one step back but is open here is a forced neighbor
+        if x > 0 and grid[x - 1, y] == 0 and grid[x - 1, y - dy] != 0:
+            return x * W + y
+        if x < H - 1 and grid[x + 1, y] == 0 and grid[x + 1, y - dy] != 0:
+            return x * W + y
+
+@njit(cache=True)
+def _jump(grid, H, W, x, y, dx, dy, ex, ey):
+    """Step from (x, y) in direction (dx, dy); return the next jump point's index or -1"""
+    if dy != 0:
+        return _jump_horizontal(grid, H, W, x, y, dy, ex, ey)
+    while True:
+        x += dx
+        if not (0 <= x < H) or grid[x, y] != 0:
+            return -1
+        if x == ex and y == ey:
+            return x * W + y
+        # Vertical run: stop where a horizontal branch leads to a jump point
+        if (_jump_horizontal(grid, H, W, x, y, -1, ex, ey) != -1
+                or _jump_horizontal(grid, H, W, x, y, 1, ex, ey) != -1):
+            return x * W + y
+
+@njit(cache=True)
+def _jps(grid, sx, sy, ex, ey):
+    """Jump Point Search kernel: return the jump-point parent array (-1 for unreached cells)"""
+    H, W = grid.shape
+    start_idx = sx * W + sy
+    end_idx = ex * W + ey
+    g = np.full(H * W, np.iinfo(np.int32).max, dtype=np.int32)  # Best known cost from start
+    closed = np.zeros((H * W + 7) >> 3, dtype=np.uint8)  # One bit per expanded jump point
+    parent = np.full(H * W, -1, dtype=np.int32)  # Previous jump point
+    g[start_idx] = 0
+    parent[start_idx] = start_idx
+    counter = 0  # Final tie-breaker so equal (f, h) pairs pop in insertion order
+    h = abs(sx - ex) + abs(sy - ey)
+    # Heap entries are (f, h, counter, cell): among equal f, prefer the cell nearest the goal
+    open_heap = [(h, h, counter, start_idx)]
+
+    while len(open_heap) > 0:
+        cidx = heapq.heappop(open_heap)[3]
+        if closed[cidx >> 3] & (1 << (cidx & 7)):
+            continue  # Stale heap entry
+        closed[cidx >> 3] |= 1 << (cidx & 7)
+        if cidx == end_idx:
+            break
+
+        cx, cy = cidx // W, cidx % W
+        px, py = parent[cidx] // W, parent[cidx] % W
+        dx, dy = np.sign(cx - px), np.sign(cy - py)
+        for k in range(4):
+            if dx == 0 and dy == 0:
+                pass  # Start cell: try every direction
+            elif dx != 0:
+                # Arrived vertically: keep going or turn either way, never back
+                if k == (0 if dx > 0 else 1):
+                    continue
+            elif k != (3 if dy > 0 else 2):
+                # Arrived horizontally: keep going, turn only into forced neighbors
+                if k >= 2:
+                    continue
+                side = cx + DX[k]
+                if not (0 <= side < H and grid[side, cy] == 0 and grid[side, cy - dy] != 0):
+                    continue
+
+            idx = _jump(grid, H, W, cx, cy, DX[k], DY[k], ex, ey)
+            if idx != -1:
+                jx, jy = idx // W, idx % W
+                new_g = g[cidx] + abs(jx - cx) + abs(jy - cy)
+                if new_g < g[idx]:
+                    g[idx] = new_g
+                    parent[idx] = cidx
+                    counter += 1
+                    h = abs(jx - ex) + abs(jy - ey)
+                    heapq.heappush(open_heap, (new_g + h, h, counter, idx))
+
+    return parent
+
+def jps(start, end, grid):
+    """Jump Point Search: A* over the cells where a shortest path may have to turn"""
+    parent = _jps(grid, start[0], start[1], end[0], end[1])
+    jump_points = reconstruct_path(parent, start, end, grid.shape[1])
+    if not jump_points:
+        return []  # Return empty list if no path exists
+
+    # Fill in the straight runs between consecutive jump points
+    path = [start]
+    for x, y in jump_points[1:]:
+        px, py = path[-1]
+        step_x, step_y = (x > px) - (x < px), (y > py) - (y < py)
+        while (px, py) != (x, y):
+            px, py = px + step_x, py + step_y
+            path.append((px, py))
+    return path
+
+def warmup():
+    """Call the JIT kernels once so compilation doesn't stall the first search"""
+    grid = create_grid(2, 2)
+    bfs((0, 0), (1, 1), grid)  # Compiles _search, which also backs dfs and idastar's reachability check
+    bibfs((0, 0), (1, 1), grid)
+    jps((0, 0), (1, 1), grid)
+
 def create_grid(rows, cols):
     """Create a grid initialized with 0s (empty cells)"""
-    return [[0 for _ in range(cols)] for _ in range(rows)]
+    return np.zeros((rows, cols), dtype=np.uint8)
 
 class RobotPuzzleApp:
     def __init__(self, root):
@@ -72,16 +383,21 @@ class RobotPuzzleApp:
         self.root.title("Robot Navigation Puzzle Game")
         
         self.grid_size = 10  # Set grid size to 10x10 for complexity
-        self.grid = create_grid(self.grid_size, self.grid_size)
+        self.grid = create_grid(self.grid_size, self.grid_size)  # uint8 ndarray, edited in place by clicks
         self.start = (0, 0)  # Fixed starting point
         self.end = None  # Initially no destination
         self.cell_size = 50  # Size of each cell in pixels
 
+        warmup()  # Compile the search kernels before the first click
+
         # Create the Tkinter canvas for grid
         self.canvas = tk.Canvas(self.root, width=self.cell_size * self.grid_size, height=self.cell_size * self.grid_size)
         self.canvas.pack()
 
-        self.draw_grid()
+        self.rect_ids = []  # Canvas item id of each cell's rectangle, indexed [row][col]
+        self.mark_ids = []  # Canvas item id of each cell's (initially hidden) path mark
+        self.end_marker = None  # Canvas item id of the destination oval
+        self.draw_grid()  # Items are created once here and then updated in place
 
         # Event to set destination or obstacles by clicking
         self.canvas.bind("<Button-1>", self.set_destination_or_obstacle)
@@ -89,11 +405,20 @@ class RobotPuzzleApp:
         # Button to find shortest path using BFS
         self.find_button = tk.Button(self.root, text="Find Shortest Path (BFS)", command=self.find_path_bfs)
         self.find_button.pack(pady=10)
+
+        # Checkbox to run the BFS button with Jump Point Search instead
+        self.use_jps = tk.BooleanVar(value=False)
+        self.jps_check = tk.Checkbutton(self.root, text="Use Jump Point Search", variable=self.use_jps)
+        self.jps_check.pack()
         
-        # Button to find shortest path using DFS
-        self.dfs_button = tk.Button(self.root, text="Find Shortest Path (DFS)", command=self.find_path_dfs)
+        # Button to find shortest path using IDA* (depth-first with a cost bound)
+        self.dfs_button = tk.Button(self.root, text="Find Shortest Path (IDA*)", command=self.find_path_dfs)
         self.dfs_button.pack(pady=10)
 
+        # Button to find shortest path using A*
+        self.astar_button = tk.Button(self.root, text="Find Shortest Path (A*)", command=self.find_path_astar)
+        self.astar_button.pack(pady=10)
+
         # Initialize robot icon
         self.robot = None
         self.visited_path = set()  # To keep track of the visited cells for marking
@@ -103,14 +428,24 @@ class RobotPuzzleApp:
         self.canvas.delete("all")  # Clear the canvas before redrawing
         
         # Draw grid cells
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
+        H, W = self.grid.shape
+        colors = np.where(self.grid == 0, "white", "black")  # Map obstacles to fill colors in one pass
+        self.rect_ids = []
+        for i in range(H):
+            row_ids = []
+            for j in range(W):
                 x1 = j * self.cell_size
                 y1 = i * self.cell_size
                 x2 = (j + 1) * self.cell_size
                 y2 = (i + 1) * self.cell_size
-                color = "white" if self.grid[i][j] == 0 else "black"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
+                row_ids.append(self.canvas.create_rectangle(x1, y1, x2, y2, fill=colors[i, j], outline="gray"))
+            self.rect_ids.append(row_ids)
+
+        # Pre-create one hidden path mark per cell, revealed by animate_robot
+        self.mark_ids = [[self.canvas.create_rectangle(j * self.cell_size + 10, i * self.cell_size + 10,
+                                                       j * self.cell_size + 40, i * self.cell_size + 40,
+                                                       state="hidden")
+                          for j in range(W)] for i in range(H)]
         
         # Draw row and column names
         for i in range(self.grid_size):
@@ -123,10 +458,20 @@ class RobotPuzzleApp:
                                 start_y * self.cell_size + 40, start_x * self.cell_size + 40, fill="green")
         
         # Draw end point (red)
-        if self.end:
-            end_x, end_y = self.end
-            self.canvas.create_oval(end_y * self.cell_size + 20, end_x * self.cell_size + 20, 
-                                    end_y * self.cell_size + 40, end_x * self.cell_size + 40, fill="red")
+        self.end_marker = None
+        self.draw_end_marker()
+
+    def draw_end_marker(self):
+        """Create the destination oval, or move it if it already exists"""
+        if not self.end:
+            return
+        end_x, end_y = self.end
+        coords = (end_y * self.cell_size + 20, end_x * self.cell_size + 20,
+                  end_y * self.cell_size + 40, end_x * self.cell_size + 40)
+        if self.end_marker is None:
+            self.end_marker = self.canvas.create_oval(*coords, fill="red")
+        else:
+            self.canvas.coords(self.end_marker, *coords)
 
     def set_destination_or_obstacle(self, event):
         """Set destination or obstacle based on click position"""
@@ -136,38 +481,58 @@ class RobotPuzzleApp:
         if (x, y) == self.start:
             return  # Do nothing if clicked on the start point
         
-        if self.grid[x][y] == 0:
+        self.clear_marks()  # Any edit to the board clears the previous trail
+        if self.grid[x, y] == 0:
             if self.end is None:
                 self.end = (x, y)  # Set destination if not set
-                self.draw_grid()
+                self.draw_end_marker()
             else:
-                self.grid[x][y] = 1  # Add obstacle (mark as 1)
-                self.draw_grid()
+                self.grid[x, y] = 1  # Add obstacle (mark as 1)
+                self.canvas.itemconfig(self.rect_ids[x][y], fill="black")
         else:
-            self.grid[x][y] = 0  # Remove obstacle if clicked again
-            self.draw_grid()
+            self.grid[x, y] = 0  # Remove obstacle if clicked again
+            self.canvas.itemconfig(self.rect_ids[x][y], fill="white")
+
+    def clear_marks(self):
+        """Hide the path marks left by previous animations"""
+        for x, y in self.visited_path:
+            self.canvas.itemconfig(self.mark_ids[x][y], state="hidden")
+        self.visited_path.clear()
 
     def find_path_bfs(self):
-        """Find the path using BFS"""
+        """Find the path using BFS, or Jump Point Search if its checkbox is ticked"""
         if not self.end:
             print("Please select a destination.")
             return
         
-        path = bfs(self.start, self.end, self.grid)
+        search = jps if self.use_jps.get() else bibfs
+        path = search(self.start, self.end, self.grid)
         if path:
             self.animate_robot(path, color="blue")  # Assign unique color for BFS
         else:
             print("No path found")
 
     def find_path_dfs(self):
-        """Find the path using DFS"""
+        """Find the path using IDA*, the depth-first shortest-path search"""
+        if not self.end:
+            print("Please select a destination.")
+            return
+        
+        path = idastar(self.start, self.end, self.grid)
+        if path:
+            self.animate_robot(path, color="green")  # Assign unique color for IDA*
+        else:
+            print("No path found")
+
+    def find_path_astar(self):
+        """Find the path using A*"""
         if not self.end:
             print("Please select a destination.")
             return
         
-        path = dfs(self.start, self.end, self.grid)
+        path = astar(self.start, self.end, self.grid)
         if path:
-            self.animate_robot(path, color="green")  # Assign unique color for DFS
+            self.animate_robot(path, color="orange")  # Assign unique color for A*
         else:
             print("No path found")
 
@@ -183,13 +548,14 @@ class RobotPuzzleApp:
                                     self.start[1] * self.cell_size + 30, self.start[0] * self.cell_size + 30,
                                     fill="blue")
 
+        marks = [self.mark_ids[x][y] for x, y in path]
+
         def move_robot(i):
             if i < len(path):
                 x, y = path[i]
                 # Leave a mark (colored square) where the robot has been
-                self.canvas.create_rectangle(y * self.cell_size + 10, x * self.cell_size + 10,
-                                                 y * self.cell_size + 40, x * self.cell_size + 40,
-                                                 fill=color)
+                self.canvas.itemconfig(marks[i], state="normal", fill=color)
+                self.visited_path.add((x, y))
                 # Move the robot
                 self.canvas.coords(self.robot, y * self.cell_size + 10, x * self.cell_size + 10,
                                    y * self.cell_size + 40, x * self.cell_size + 40)